@@ -0,0 +1,85 @@
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from Game import Game
+from Volleyball import open_settings
+
+
+class AllocationBudget:
+    FRAME_PEAK_BYTES = 2048
+    GROWTH_BYTES = 4096
+    WARMUP_FRAMES = 300
+    FRAMES = 1200
+    JUMP_EVERY = 45
+
+    def __init__(self, frames=FRAMES, warmup_frames=WARMUP_FRAMES):
+        self.frames = frames
+        self.warmup_frames = warmup_frames
+        self.collections = 0
+        window_size, fps = open_settings(Game.SETTINGS)
+        self.game = Game(window_size, 0)
+
+    def count_collection(self, phase, info):
+        if phase == 'start':
+            self.collections += 1
+
+    def play_frame(self, frame):
+        if frame % AllocationBudget.JUMP_EVERY == 0:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP))
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w))
+        if frame % (2 * AllocationBudget.JUMP_EVERY) == 0:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_d))
+        elif frame % (2 * AllocationBudget.JUMP_EVERY) == AllocationBudget.JUMP_EVERY:
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT))
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_d))
+        self.game.interface()
+        self.game.step()
+
+    def measure(self):
+        for frame in range(self.warmup_frames):
+            self.play_frame(frame)
+
+        gc.collect()
+        gc.callbacks.append(self.count_collection)
+        tracemalloc.start()
+        start, _ = tracemalloc.get_traced_memory()
+        frame_peak = 0
+        for frame in range(self.warmup_frames, self.warmup_frames + self.frames):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self.play_frame(frame)
+            _, peak = tracemalloc.get_traced_memory()
+            frame_peak = max(frame_peak, peak - before)
+        end, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        gc.callbacks.remove(self.count_collection)
+
+        return {'frame_peak': frame_peak, 'growth': end - start, 'collections': self.collections}
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Check that steady-state frames stay within the allocation budget.')
+    parser.add_argument('--frames', type=int, default=AllocationBudget.FRAMES)
+    parser.add_argument('--warmup', type=int, default=AllocationBudget.WARMUP_FRAMES)
+    arguments = parser.parse_args()
+
+    result = AllocationBudget(arguments.frames, arguments.warmup).measure()
+    print('peak allocation per frame: {} B (budget {} B)'.format(result['frame_peak'],
+                                                                 AllocationBudget.FRAME_PEAK_BYTES))
+    print('growth over {} frames: {} B (budget {} B)'.format(arguments.frames, result['growth'],
+                                                             AllocationBudget.GROWTH_BYTES))
+    print('gc collections: {}'.format(result['collections']))
+
+    if result['frame_peak'] > AllocationBudget.FRAME_PEAK_BYTES or result['growth'] > AllocationBudget.GROWTH_BYTES:
+        print('Allocation budget exceeded')
+        sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,188 @@
+import asyncio
+import collections
+import concurrent.futures
+import json
+import time
+import pygame
+
+from Game import Game
+from WorldHash import WorldHash, world_state
+from SettingsWatcher import SettingsWatcher
+
+
+class AsyncRunner:
+    HOST = '127.0.0.1'
+    REMOTE_KEYS = Game.MOVE_KEYS + (pygame.K_UP, pygame.K_w)
+    REMOTE_ACTIONS = {'down': pygame.KEYDOWN, 'up': pygame.KEYUP}
+    SPECTATOR_BUFFER = 64 * 1024
+    JITTER_SAMPLES = 600
+    LOG_FLUSH_INTERVAL = 1.0
+    CLIENT_CLOSE_TIMEOUT = 1.0
+
+    def __init__(self, game, settings_watcher=None, remote_input_port=None, spectator_port=None, log_path=None,
+                 world_hash=None, host=HOST):
+        self.game = game
+        self.game.set_blocking(False)
+        self.settings_watcher = settings_watcher
+        self.host = host
+        self.remote_input_port = remote_input_port
+        self.spectator_port = spectator_port
+        self.log_path = log_path
+        self.world_hash = world_hash
+
+        self.tick = 0
+        self.jitter = collections.deque(maxlen=AsyncRunner.JITTER_SAMPLES)
+        self.spectators = set()
+        self.clients = {}
+        self.log_lines = []
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+    def get_jitter(self):
+        return jitter_stats(self.jitter)
+
+    def log(self, line):
+        if self.log_path:
+            self.log_lines.append('{:.3f} {}\n'.format(time.time(), line))
+
+    async def run_in_thread(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def run(self, frames=None):
+        tasks = []
+        servers = []
+        if self.settings_watcher:
+            tasks.append(asyncio.create_task(self.watch_settings()))
+        if self.log_path:
+            tasks.append(asyncio.create_task(self.flush_log_periodically()))
+        if self.remote_input_port:
+            servers.append(await asyncio.start_server(self.handle_remote_input, self.host,
+                                                      self.remote_input_port))
+        if self.spectator_port:
+            servers.append(await asyncio.start_server(self.handle_spectator, self.host, self.spectator_port))
+
+        try:
+            await self.run_frames(frames)
+        finally:
+            for task in tasks:
+                task.cancel()
+            for server in servers:
+                server.close()
+            await self.close_clients()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for server in servers:
+                await server.wait_closed()
+            if self.log_lines:
+                self.write_log(self.log_lines)
+            self.executor.shutdown(wait=False)
+
+    async def run_frames(self, frames=None):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        last_start = None
+        period = 0.0
+        while frames is None or self.tick < frames:
+            start = loop.time()
+            if last_start is not None:
+                self.jitter.append(abs(start - last_start - period))
+            last_start = start
+
+            self.game.interface()
+            self.game.step()
+            if self.world_hash:
+                self.world_hash.record(self.game)
+            if self.spectators:
+                self.publish_state()
+            self.tick += 1
+
+            period = self.game.frame_period()
+            deadline += period
+            now = loop.time()
+            if deadline < now:
+                deadline = now
+            await asyncio.sleep(deadline - now)
+
+    def publish_state(self):
+        line = (json.dumps({'tick': self.tick, 'state': world_state(self.game)}) + '\n').encode()
+        for writer in list(self.spectators):
+            if writer.is_closing():
+                self.spectators.discard(writer)
+            elif writer.transport.get_write_buffer_size() < AsyncRunner.SPECTATOR_BUFFER:
+                writer.write(line)
+
+    async def close_clients(self):
+        if not self.clients:
+            return
+        for writer in self.clients.values():
+            writer.close()
+        done, pending = await asyncio.wait(list(self.clients), timeout=AsyncRunner.CLIENT_CLOSE_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def handle_spectator(self, reader, writer):
+        self.clients[asyncio.current_task()] = writer
+        writer.write((json.dumps({'fields': WorldHash.FIELDS, 'quantization': WorldHash.QUANTIZATION}) +
+                      '\n').encode())
+        self.spectators.add(writer)
+        self.log('spectator connected')
+        try:
+            while await reader.read(1024):
+                pass
+        finally:
+            self.clients.pop(asyncio.current_task(), None)
+            self.spectators.discard(writer)
+            writer.close()
+            self.log('spectator disconnected')
+
+    async def handle_remote_input(self, reader, writer):
+        self.clients[asyncio.current_task()] = writer
+        self.log('remote input connected')
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                words = line.decode(errors='replace').split()
+                if len(words) != 2 or words[0] not in AsyncRunner.REMOTE_ACTIONS:
+                    continue
+                try:
+                    key = pygame.key.key_code(words[1])
+                except ValueError:
+                    continue
+                if key in AsyncRunner.REMOTE_KEYS:
+                    pygame.event.post(pygame.event.Event(AsyncRunner.REMOTE_ACTIONS[words[0]], key=key))
+        finally:
+            self.clients.pop(asyncio.current_task(), None)
+            writer.close()
+            self.log('remote input disconnected')
+
+    async def flush_log_periodically(self):
+        while True:
+            await asyncio.sleep(AsyncRunner.LOG_FLUSH_INTERVAL)
+            stats = self.get_jitter()
+            self.log('tick {} jitter mean {:.3f} ms p95 {:.3f} ms max {:.3f} ms'.format(
+                self.tick, stats['mean'], stats['p95'], stats['max']))
+            lines, self.log_lines = self.log_lines, []
+            await self.run_in_thread(self.write_log, lines)
+
+    def write_log(self, lines):
+        with open(self.log_path, 'a') as log:
+            log.writelines(lines)
+
+    async def watch_settings(self):
+        while True:
+            await asyncio.sleep(SettingsWatcher.POLL_INTERVAL)
+            settings = await self.run_in_thread(self.settings_watcher.check)
+            if settings:
+                window_size, fps = settings
+                self.game.apply_settings(window_size, fps)
+                self.log('settings reloaded: window_size = {}; fps = {}'.format(window_size, fps))
+
+
+def jitter_stats(jitter):
+    if not jitter:
+        return {'mean': 0.0, 'p95': 0.0, 'max': 0.0}
+    ordered = sorted(jitter)
+    return {'mean': 1000 * sum(ordered) / len(ordered),
+            'p95': 1000 * ordered[min(int(0.95 * len(ordered)), len(ordered) - 1)],
+            'max': 1000 * ordered[-1]}
\ No newline at end of file
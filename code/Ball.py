@@ -4,11 +4,15 @@ import pymunk.pygame_util
 
 
 class Ball:
+    __slots__ = ('mass', 'radius', 'max_velocity', 'max_angular_velocity', 'start_pos_for_first_player',
+                 'start_pos_for_second_player', 'start_positions', 'body', 'shape', 'attributes_to_pause',
+                 'position_to_breaks')
     MASS = 0.1
     MAX_VELOCITY = pymunk.Vec2d(1000.0, 1000.0)
     MAX_ANGULAR_VELOCITY = 25.0
     RADIUS = 30
     IMAGE = "res/img/ball.png"
+    ZERO = (0.0, 0.0)
 
     def __init__(self, space, pos_first_player, pos_second_player, scale_factor):
         self.mass = Ball.MASS * scale_factor['x']
@@ -19,6 +23,8 @@ class Ball:
 
         self.start_pos_for_first_player = pymunk.Vec2d(pos_first_player)
         self.start_pos_for_second_player = pymunk.Vec2d(pos_second_player)
+        self.start_positions = {'player1': self.start_pos_for_first_player,
+                                'player2': self.start_pos_for_second_player}
 
         moment = pymunk.moment_for_circle(self.mass, 0, self.radius)
         self.body = pymunk.Body(self.mass, moment)
@@ -36,7 +42,7 @@ class Ball:
         self.body.sleep()
 
     def get_start_positions(self):
-        return {'player1': self.start_pos_for_first_player, 'player2': self.start_pos_for_second_player}
+        return self.start_positions
 
     def get_position(self):
         return self.body.position
@@ -50,9 +56,15 @@ class Ball:
     def get_radius(self):
         return self.radius
 
+    def get_velocity(self):
+        return self.body.velocity
+
     def get_body_angle(self):
         return self.body.angle
 
+    def get_angular_velocity(self):
+        return self.body.angular_velocity
+
     def is_sleeping(self):
         return self.body.is_sleeping
 
@@ -84,16 +96,48 @@ class Ball:
         self.body.sleep()
 
     def check_velocity_restrictions(self):
-        if abs(self.body.velocity.x) > self.max_velocity.x:
-            self.body.velocity = pymunk.Vec2d(sign(self.body.velocity.x) * self.max_velocity.x, self.body.velocity.y)
-        if abs(self.body.velocity.y) > self.max_velocity.y:
-            self.body.velocity = pymunk.Vec2d(self.body.velocity.x, sign(self.body.velocity.y) * self.max_velocity.y)
+        velocity = self.body.velocity
+        if abs(velocity.x) > self.max_velocity.x or abs(velocity.y) > self.max_velocity.y:
+            x = velocity.x
+            y = velocity.y
+            if abs(x) > self.max_velocity.x:
+                x = sign(x) * self.max_velocity.x
+            if abs(y) > self.max_velocity.y:
+                y = sign(y) * self.max_velocity.y
+            self.body.velocity = (x, y)
+
+        angular_velocity = self.body.angular_velocity
+        if abs(angular_velocity) > self.max_angular_velocity:
+            self.body.angular_velocity = sign(angular_velocity) * self.max_angular_velocity
+
+    def overlaps_circle(self, x, y, radius):
+        position = self.body.position
+        dx = position.x - x
+        dy = position.y - y
+        limit = self.radius + radius
+        return dx * dx + dy * dy < limit * limit
+
+    def restore_from(self, other, ratio_x, ratio_y):
+        velocity = other.attributes_to_pause['vel']
+        self.attributes_to_pause = {'vel': pymunk.Vec2d(velocity.x * ratio_x, velocity.y * ratio_y),
+                                    'ang_vel': other.attributes_to_pause['ang_vel'],
+                                    'sleeping': other.attributes_to_pause['sleeping']}
+        self.position_to_breaks = {'pos': self.rescale_position(other.position_to_breaks['pos'], other.radius,
+                                                                ratio_x, ratio_y),
+                                   'angle': other.position_to_breaks['angle']}
+
+        self.body.position = self.rescale_position(other.body.position, other.radius, ratio_x, ratio_y)
+        self.body.velocity = (other.body.velocity.x * ratio_x, other.body.velocity.y * ratio_y)
+        self.body.angle = other.body.angle
+        self.body.angular_velocity = other.body.angular_velocity
+        if other.body.is_sleeping:
+            self.body.sleep()
 
-        if abs(self.body.angular_velocity) > self.max_angular_velocity:
-            self.body.angular_velocity = sign(self.body.angular_velocity) * self.max_angular_velocity
+    def rescale_position(self, position, radius, ratio_x, ratio_y):
+        return pymunk.Vec2d(position.x * ratio_x, (position.y - radius) * ratio_y + self.radius)
 
     def stop(self):
-        self.body.velocity = pymunk.Vec2d.zero()
+        self.body.velocity = Ball.ZERO
         self.body.angular_velocity = 0
 
 def sign(x):
@@ -3,11 +3,14 @@ import pymunk.pygame_util
 
 
 class Frame:
+    __slots__ = ('position1', 'position2', 'width', 'body', 'shape', 'direction', 'length_sq')
 
     def __init__(self, space, pos1, pos2, width):
         self.position1 = pymunk.Vec2d(pos1)
         self.position2 = pymunk.Vec2d(pos2)
         self.width = width
+        self.direction = self.position2 - self.position1
+        self.length_sq = self.direction.get_length_sqrd()
         self.body = pymunk.Body(body_type=pymunk.Body.STATIC)
         self.shape = pymunk.Segment(self.body, pos1, pos2, width)
         space.add(self.shape)
@@ -18,14 +21,27 @@ class Frame:
     def get_positions(self):
         return self.position1, self.position2
 
+    def overlaps_circle(self, x, y, radius):
+        dx = x - self.position1.x
+        dy = y - self.position1.y
+        t = 0.0
+        if self.length_sq > 0.0:
+            t = min(max((dx * self.direction.x + dy * self.direction.y) / self.length_sq, 0.0), 1.0)
+        dx -= t * self.direction.x
+        dy -= t * self.direction.y
+        limit = self.width + radius
+        return dx * dx + dy * dy < limit * limit
+
 
 class Ground(Frame):
+    __slots__ = ()
 
     def __init__(self, space, pos1, pos2, width):
         super(Ground, self).__init__(space, pos1, pos2, width)
 
 
 class Wall(Frame):
+    __slots__ = ()
 
     def __init__(self, space, pos1, pos2, width):
         super(Wall, self).__init__(space, pos1, pos2, width)
@@ -34,6 +50,7 @@ class Wall(Frame):
 
 
 class Net(Frame):
+    __slots__ = ()
     NET_COLOR = (150, 80, 0)
     THICKNESS = 5
 
@@ -1,4 +1,5 @@
 import sys
+import collections
 import pygame
 from pygame.locals import *
 import pymunk
@@ -7,8 +8,9 @@ import math
 
 from Player import Player
 from Ball import Ball
-from Frame import Ground, Wall, Net
+from Frame import Frame, Ground, Wall, Net
 from Text import Text
+from Snapshot import Snapshot
 
 
 class Game:
@@ -21,17 +23,25 @@ class Game:
     JUMP_SOUND = "res/sounds/Jump.wav"
     SETTINGS = "res/Settings.txt"
     STEP_WORLD = 1/50.0
+    BALL_ROTATIONS = 120
+    MOVE_KEYS = (K_LEFT, K_RIGHT, K_a, K_d)
+    REDRAW_EVENTS = (pygame.KEYDOWN, pygame.VIDEOEXPOSE, pygame.ACTIVEEVENT)
+    IDLE_FPS = 5
+    ASSET_CACHE_SIZE = 3
+    MIN_WINDOW_SIZE = (320, 180)
+    images = {}
     gained_point = {'player1': False, 'player2': False}
     break_timer = 0
 
     def __init__(self, window_size, fps):
-        window = pymunk.Vec2d(window_size)
-
-        self.window = window
         self.FPS = fps
 
         self.paused = False
         self.waiting = False
+        self.redraw = True
+        self.blocking = True
+        self.latency_monitor = None
+        self.keys_pressed = dict.fromkeys(Game.MOVE_KEYS, False)
 
         pygame.mixer.pre_init(44100, -16, 2, 2048)
         pygame.mixer.init()
@@ -45,9 +55,17 @@ class Game:
         self.jump_sound = pygame.mixer.Sound(Game.JUMP_SOUND)
 
         self.fpsClock = pygame.time.Clock()
-        self.screen = pygame.display.set_mode(window_size)
+        self.screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
         pygame.display.set_caption(Game.CAPTION)
 
+        self.assets = collections.OrderedDict()
+        self.create_world(window_size)
+        self.load_assets()
+
+    def create_world(self, window_size):
+        window = pymunk.Vec2d(window_size)
+        self.window = window
+
         scale_factor_x_y = pymunk.Vec2d(window.x / 1200, window.y / 650)
         self.scale_factor = {'x': scale_factor_x_y.x, 'y': scale_factor_x_y.y,
                              'xy': min(scale_factor_x_y.x, scale_factor_x_y.y)}
@@ -70,21 +88,72 @@ class Game:
                          self.scale_factor)
 
         self.frames = self.create_frames(self.space, window, self.scale_factor)
-        self.game_texts = self.create_texts(window, self.scale_factor)
-
-        self.background = self.load_image(window_size, self.BACKGROUND, True)
-        self.ball_image = self.load_image((int(2 * self.ball.get_radius()),
-                                           int(2 * self.ball.get_radius())), Ball.IMAGE, False)
-        self.player1_image = self.load_image((int(2 * self.player1.get_radius()),
-                                              int(2 * self.player1.get_radius())), Player.IMAGE['player1'], False)
-        self.player2_image = self.load_image((int(2 * self.player2.get_radius()),
-                                              int(2 * self.player2.get_radius())), Player.IMAGE['player2'], False)
+        self.frames_to_bounce = tuple(self.frames.values())
+        self.net_x = self.frames['net'].get_positions()[0].x
 
-        self.draw_options = pymunk.pygame_util.DrawOptions(self.screen)
-        self.draw_options.flags = pymunk.SpaceDebugDrawOptions.DRAW_SHAPES
+    def load_assets(self):
+        key = (int(self.window.x), int(self.window.y))
+        if key in self.assets:
+            self.assets.move_to_end(key)
+        else:
+            self.assets[key] = self.create_assets()
+            if len(self.assets) > Game.ASSET_CACHE_SIZE:
+                self.assets.popitem(last=False)
+        assets = self.assets[key]
+
+        self.background = assets['background']
+        self.ball_image = assets['ball_image']
+        self.player1_image = assets['player1_image']
+        self.player2_image = assets['player2_image']
+        self.ball_images = assets['ball_images']
+        self.scene_background = assets['scene_background']
+        self.game_texts = dict(assets['game_texts'])
+
+    def create_assets(self):
+        window_size = (int(self.window.x), int(self.window.y))
+        background = self.load_image(window_size, self.BACKGROUND, True)
+        ball_image = self.load_image((int(2 * self.ball.get_radius()),
+                                      int(2 * self.ball.get_radius())), Ball.IMAGE, False)
+        player1_image = self.load_image((int(2 * self.player1.get_radius()),
+                                         int(2 * self.player1.get_radius())), Player.IMAGE['player1'], False)
+        player2_image = self.load_image((int(2 * self.player2.get_radius()),
+                                         int(2 * self.player2.get_radius())), Player.IMAGE['player2'], False)
+
+        return {'background': background, 'ball_image': ball_image, 'player1_image': player1_image,
+                'player2_image': player2_image, 'ball_images': self.create_ball_images(ball_image),
+                'scene_background': self.create_scene_background(background),
+                'game_texts': self.create_texts(self.window, self.scale_factor)}
+
+    def resize(self, window_size):
+        window_size = (max(int(window_size[0]), Game.MIN_WINDOW_SIZE[0]),
+                       max(int(window_size[1]), Game.MIN_WINDOW_SIZE[1]))
+        if window_size == (int(self.window.x), int(self.window.y)):
+            return
+        ratio_x = window_size[0] / self.window.x
+        ratio_y = window_size[1] / self.window.y
+        ball, player1, player2 = self.ball, self.player1, self.player2
+        score_text = self.game_texts['general_score_text'].get_text()
+        winner_text = self.end_game()
+
+        self.screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+        self.create_world(window_size)
+        self.ball.restore_from(ball, ratio_x, ratio_y)
+        self.player1.restore_from(player1, ratio_x, ratio_y)
+        self.player2.restore_from(player2, ratio_x, ratio_y)
+
+        self.load_assets()
+        self.game_texts['general_score_text'] = self.create_score_text(score_text)
+        if winner_text:
+            self.game_texts['winner_text'] = self.create_winner_text(winner_text.get_text())
+        self.redraw = True
+
+    def apply_settings(self, window_size, fps):
+        self.FPS = fps
+        self.resize(window_size)
 
     def pause(self):
         self.paused = True
+        self.redraw = True
         self.ball.save_attributes_to_pause()
         self.player1.save_attribute_to_pause()
         self.player2.save_attribute_to_pause()
@@ -97,47 +166,65 @@ class Game:
 
     def resume(self):
         self.paused = False
+        self.redraw = True
         self.ball.wakes_up()
         self.player1.wakes_up()
         self.player2.wakes_up()
 
     def restart(self):
         self.paused = False
+        self.redraw = True
         self.game_texts['winner_text'] = None
         self.player1.clear_score()
         self.player2.clear_score()
-        self.game_texts['general_score_text'] = Text(Text.MAIN_FONT, self.scale_factor['xy'], Text.BLACK, '0:0',
-                                                     self.window.x / 2, 0.25 * self.window.y)
+        self.game_texts['general_score_text'] = self.create_score_text('0:0')
 
     def is_paused(self):
         return self.paused
 
     def wait(self, waiting):
         self.waiting = waiting
+        self.redraw = True
 
     def is_waiting(self):
         return self.waiting
 
+    def is_idle(self):
+        return self.is_paused() or self.is_waiting()
+
+    def set_blocking(self, blocking):
+        self.blocking = blocking
+
+    def set_latency_monitor(self, latency_monitor):
+        self.latency_monitor = latency_monitor
+
+    def frame_period(self):
+        if self.is_paused():
+            return 1.0 / Game.IDLE_FPS
+        return 1.0 / self.FPS if self.FPS > 0 else 0.0
+
     def check_if_someone_won(self):
         if self.player1.check_if_won():
             self.player1.is_winner()
             self.pause()
-            self.game_texts['winner_text'] = Text(Text.MAIN_FONT, 1.3 * self.scale_factor['xy'], Text.RED,
-                                                  'PLAYER 1 WON', self.window.x / 2, self.window.y / 2)
+            self.game_texts['winner_text'] = self.create_winner_text('PLAYER 1 WON')
         elif self.player2.check_if_won():
             self.player2.is_winner()
             self.pause()
-            self.game_texts['winner_text'] = Text(Text.MAIN_FONT, 1.3 * self.scale_factor['xy'], Text.RED,
-                                                  'PLAYER 2 WON', self.window.x / 2, self.window.y / 2)
+            self.game_texts['winner_text'] = self.create_winner_text('PLAYER 2 WON')
 
     def end_game(self):
         return self.game_texts['winner_text']
 
     def update_general_score_text(self):
-        self.game_texts['general_score_text'] = Text(Text.MAIN_FONT, self.scale_factor['xy'],
-                                                     Text.BLACK, '{}:{}'.format(self.player2.get_score(),
-                                                                                self.player1.get_score()),
-                                                     self.window.x / 2, 0.25 * self.window.y)
+        self.game_texts['general_score_text'] = self.create_score_text('{}:{}'.format(self.player2.get_score(),
+                                                                                      self.player1.get_score()))
+
+    def create_score_text(self, text):
+        return Text(Text.MAIN_FONT, self.scale_factor['xy'], Text.BLACK, text, self.window.x / 2, 0.25 * self.window.y)
+
+    def create_winner_text(self, text):
+        return Text(Text.MAIN_FONT, 1.3 * self.scale_factor['xy'], Text.RED, text, self.window.x / 2, self.window.y / 2)
 
     def update_player1(self, list_of_events):
         for event in list_of_events:
@@ -149,37 +236,30 @@ class Game:
                 if event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT:
                     self.player1.stop()
 
-        if self.player1.get_position().y <= self.player1.get_start_position().y + 20 * self.scale_factor['y'] and\
-                self.player1.is_falling():
+        position = self.player1.get_position()
+        radius = self.player1.get_radius()
+        if position.y <= self.player1.get_landing_height() and self.player1.is_falling():
             self.player1.set_jumping(False)
             self.player1.definitive_stop()
-            self.player1.set_position((self.player1.get_position().x, self.player1.get_start_position().y))
+            self.player1.set_position((position.x, self.player1.get_start_position().y))
+            position = self.player1.get_position()
 
-        if self.player1.get_position().x - self.player1.get_radius() <=\
-                self.frames['net'].get_positions()[0].x + 0.3 * self.player1.get_radius():
-            self.player1.set_block_move(True, 'left')
-        else:
-            self.player1.set_block_move(False, 'left')
-        if self.player1.get_position().x >= self.window.x - 1.3 * self.player1.get_radius():
-            self.player1.set_block_move(True, 'right')
-        else:
-            self.player1.set_block_move(False, 'right')
+        self.player1.set_block_move(position.x - radius <= self.net_x + 0.3 * radius, 'left')
+        self.player1.set_block_move(position.x >= self.window.x - 1.3 * radius, 'right')
 
-        keys_pressed = pygame.key.get_pressed()
-        if keys_pressed[K_RIGHT]:
-            if self.player1.get_block_move()['right']:
+        if self.keys_pressed[K_RIGHT]:
+            if self.player1.is_move_blocked('right'):
                 self.player1.stop()
-                self.player1.set_position((self.window.x - self.player1.get_radius(), self.player1.get_position().y))
+                self.player1.set_position((self.window.x - radius, position.y))
             else:
                 self.player1.moves(1)
-        if keys_pressed[K_LEFT]:
-            if self.player1.get_block_move()['left']:
+        if self.keys_pressed[K_LEFT]:
+            if self.player1.is_move_blocked('left'):
                 self.player1.stop()
-                self.player1.set_position((self.frames['net'].get_positions()[0].x + 1.3 * self.player1.get_radius(),
-                                           self.player1.get_position().y))
+                self.player1.set_position((self.net_x + 1.3 * radius, position.y))
             else:
                 self.player1.moves(-1)
-        if keys_pressed[K_RIGHT] and keys_pressed[K_LEFT]:
+        if self.keys_pressed[K_RIGHT] and self.keys_pressed[K_LEFT]:
             self.player1.stop()
 
     def update_player2(self, list_of_events):
@@ -192,37 +272,30 @@ class Game:
                 if event.key == pygame.K_a or event.key == pygame.K_d:
                     self.player2.stop()
 
-        if self.player2.get_position().y <= self.player2.get_start_position().y + 20 * self.scale_factor['y'] and\
-                self.player2.is_falling():
+        position = self.player2.get_position()
+        radius = self.player2.get_radius()
+        if position.y <= self.player2.get_landing_height() and self.player2.is_falling():
             self.player2.set_jumping(False)
             self.player2.definitive_stop()
-            self.player2.set_position((self.player2.get_position().x, self.player2.get_start_position().y))
+            self.player2.set_position((position.x, self.player2.get_start_position().y))
+            position = self.player2.get_position()
 
-        if self.player2.get_position().x + self.player2.get_radius() >= \
-                self.frames['net'].get_positions()[0].x - 0.3 * self.player2.get_radius():
-            self.player2.set_block_move(True, 'right')
-        else:
-            self.player2.set_block_move(False, 'right')
-        if self.player2.get_position().x <= 1.3 * self.player2.get_radius():
-            self.player2.set_block_move(True, 'left')
-        else:
-            self.player2.set_block_move(False, 'left')
+        self.player2.set_block_move(position.x + radius >= self.net_x - 0.3 * radius, 'right')
+        self.player2.set_block_move(position.x <= 1.3 * radius, 'left')
 
-        keys_pressed = pygame.key.get_pressed()
-        if keys_pressed[K_d]:
-            if self.player2.get_block_move()['right']:
+        if self.keys_pressed[K_d]:
+            if self.player2.is_move_blocked('right'):
                 self.player2.stop()
-                self.player2.set_position((self.frames['net'].get_positions()[0].x - 1.3 * self.player2.get_radius(),
-                                           self.player2.get_position().y))
+                self.player2.set_position((self.net_x - 1.3 * radius, position.y))
             else:
                 self.player2.moves(1)
-        if keys_pressed[K_a]:
-            if self.player2.get_block_move()['left']:
+        if self.keys_pressed[K_a]:
+            if self.player2.is_move_blocked('left'):
                 self.player2.stop()
-                self.player2.set_position((self.player2.get_radius(), self.player2.get_position().y))
+                self.player2.set_position((radius, position.y))
             else:
                 self.player2.moves(-1)
-        if keys_pressed[K_a] and keys_pressed[K_d]:
+        if self.keys_pressed[K_a] and self.keys_pressed[K_d]:
             self.player2.stop()
 
     def check_if_ball_collides_with_sth(self):
@@ -248,8 +321,9 @@ class Game:
         else:
             self.player1.set_collision_with_ball(False)
 
-        for key in self.frames:
-            if self.check_collision(self.frames[key], self.ball):
+        ball_position = self.ball.get_position()
+        for frame in self.frames_to_bounce:
+            if frame.overlaps_circle(ball_position.x, ball_position.y, self.ball.get_radius()):
                 pygame.mixer.Sound.play(self.bounce_ball_sound)
 
     def check_if_point_is_gained(self):
@@ -314,12 +388,32 @@ class Game:
         else:
             Game.break_timer += 1
 
-    def interface(self):
-        list_of_events = pygame.event.get()
+    def get_events(self):
+        if not self.is_paused() or not self.blocking:
+            return pygame.event.get()
+        event = pygame.event.wait(1000 // Game.IDLE_FPS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def interface(self, list_of_events=None):
+        if list_of_events is None:
+            list_of_events = self.get_events()
+        if self.latency_monitor:
+            self.latency_monitor.sampled(list_of_events, self.is_paused() and self.blocking)
+        window_size = None
         for event in list_of_events:
             if event.type == pygame.QUIT:
                 self.exit_game()
+            if event.type == pygame.VIDEORESIZE:
+                window_size = event.size
+            if event.type in Game.REDRAW_EVENTS:
+                self.redraw = True
+            if event.type == pygame.KEYUP and event.key in self.keys_pressed:
+                self.keys_pressed[event.key] = False
             if event.type == pygame.KEYDOWN:
+                if event.key in self.keys_pressed:
+                    self.keys_pressed[event.key] = True
                 if event.key == pygame.K_p and not self.end_game():
                     if self.is_paused():
                         self.resume()
@@ -331,6 +425,8 @@ class Game:
                     self.handle_music()
                 if event.key == pygame.K_ESCAPE:
                     self.exit_game()
+        if window_size:
+            self.resize(window_size)
 
         if not self.is_waiting() and not self.is_paused():
             self.update_player1(list_of_events)
@@ -341,45 +437,78 @@ class Game:
             self.break_after_gained_point()
 
     def step(self):
-        self.space.step(Game.STEP_WORLD)
-
-        self.draw_background(self.screen, self.background)
-        self.space.debug_draw(self.draw_options)
-        self.draw_help_background()
+        if self.is_idle():
+            if self.redraw:
+                self.draw_scene()
+            elif self.latency_monitor:
+                self.latency_monitor.not_presented()
+            if self.is_waiting():
+                self.wait_for_next_frame()
+            return
 
-        self.draw_text(self.game_texts['general_score_text'].to_draw())
+        self.simulate()
 
-        if self.is_paused() and not self.end_game():
-            self.draw_text(self.game_texts['press_resume_text'].to_draw())
-            self.draw_text(self.game_texts['press_quit_text'].to_draw())
-        elif not self.end_game():
-            self.draw_text(self.game_texts['press_pause_text'].to_draw())
-            self.draw_text(self.game_texts['press_quit_text'].to_draw())
-        if pygame.mixer.music.get_busy():
-            self.draw_text(self.game_texts['press_stop_music_text'].to_draw())
-        else:
-            self.draw_text(self.game_texts['press_play_music_text'].to_draw())
-
-        self.draw_text(self.game_texts['copyright_text'].to_draw())
+        self.draw_scene()
+        self.wait_for_next_frame()
 
+    def simulate(self):
+        self.space.step(Game.STEP_WORLD)
         self.ball.check_velocity_restrictions()
 
-        if not self.is_waiting():
-            self.draw_ball()
-            self.draw_players()
+    def wait_for_next_frame(self):
+        if self.blocking:
+            self.fpsClock.tick(self.FPS)
+
+    def take_snapshot(self):
+        if self.is_waiting():
+            ball_position = self.ball.get_position_to_breaks()['pos']
+            ball_angle = self.ball.get_position_to_breaks()['angle']
+            player1_position = self.player1.get_position_to_breaks()
+            player2_position = self.player2.get_position_to_breaks()
         else:
-            self.fake_draw_ball()
-            self.fake_draw_players()
+            ball_position = self.ball.get_position()
+            ball_angle = self.ball.get_body_angle()
+            player1_position = self.player1.get_position()
+            player2_position = self.player2.get_position()
+        return Snapshot(ball_position.x, ball_position.y, ball_angle, player1_position.x, player1_position.y,
+                        player2_position.x, player2_position.y, self.game_texts['general_score_text'],
+                        self.game_texts['winner_text'], self.is_paused(), pygame.mixer.music.get_busy())
 
-        if self.is_paused() and not self.end_game():
-            self.draw_text(self.game_texts['pause_text'].to_draw())
-        elif self.end_game():
-            self.draw_text(self.game_texts['winner_text'].to_draw())
-            self.draw_text(self.game_texts['restart_text'].to_draw())
-            self.draw_text(self.game_texts['quit_text'].to_draw())
+    def draw_scene(self):
+        self.draw_snapshot(self.take_snapshot())
 
         pygame.display.flip()
-        self.fpsClock.tick(self.FPS)
+        self.redraw = False
+        if self.latency_monitor:
+            self.latency_monitor.presented()
+
+    def draw_snapshot(self, snapshot):
+        self.draw_background(self.screen, self.scene_background)
+
+        self.draw_text(snapshot.score_text)
+
+        if snapshot.is_paused() and not snapshot.end_game():
+            self.draw_text(self.game_texts['press_resume_text'])
+            self.draw_text(self.game_texts['press_quit_text'])
+        elif not snapshot.end_game():
+            self.draw_text(self.game_texts['press_pause_text'])
+            self.draw_text(self.game_texts['press_quit_text'])
+        if snapshot.music_playing:
+            self.draw_text(self.game_texts['press_stop_music_text'])
+        else:
+            self.draw_text(self.game_texts['press_play_music_text'])
+
+        self.draw_text(self.game_texts['copyright_text'])
+
+        self.draw_ball(snapshot)
+        self.draw_players(snapshot)
+
+        if snapshot.is_paused() and not snapshot.end_game():
+            self.draw_text(self.game_texts['pause_text'])
+        elif snapshot.end_game():
+            self.draw_text(snapshot.winner_text)
+            self.draw_text(self.game_texts['restart_text'])
+            self.draw_text(self.game_texts['quit_text'])
 
     @staticmethod
     def create_space(gravity):
@@ -441,56 +570,58 @@ class Game:
 
     @staticmethod
     def check_collision(ob1, ob2):
-        return bool(ob1.get_shape().shapes_collide(ob2.get_shape()).points)
+        if isinstance(ob2, Frame):
+            ob1, ob2 = ob2, ob1
+        position = ob2.get_position()
+        return ob1.overlaps_circle(position.x, position.y, ob2.get_radius())
 
     @staticmethod
     def load_image(window_size, source, with_convert):
-        if with_convert:
-            picture = pygame.image.load(source).convert()
-        else:
-            picture = pygame.image.load(source)
-        return pygame.transform.scale(picture, window_size)
+        key = (source, with_convert)
+        if key not in Game.images:
+            if with_convert:
+                Game.images[key] = pygame.image.load(source).convert()
+            else:
+                Game.images[key] = pygame.image.load(source)
+        return pygame.transform.scale(Game.images[key], window_size)
 
     @staticmethod
     def draw_background(screen, image):
         screen.blit(image, (0, 0))
 
-    def draw_help_background(self):
-        surf = pygame.Surface((self.window.x, self.window.y / 22))
-        surf.blit(self.background, (0, -self.window.y + self.window.y / 22))
-        self.screen.blit(surf, (0, self.window.y - self.window.y / 22))
+    def create_scene_background(self, background):
+        scene = background.copy()
+        net = self.frames['net']
+        pymunk.pygame_util.DrawOptions(scene).draw_fat_segment(net.get_positions()[0], net.get_positions()[1],
+                                                               net.get_shape().radius, Net.NET_COLOR, Net.NET_COLOR)
+        help_background = pygame.Surface((self.window.x, self.window.y / 22))
+        help_background.blit(background, (0, -self.window.y + self.window.y / 22))
+        scene.blit(help_background, (0, self.window.y - self.window.y / 22))
+        return scene
 
     def draw_text(self, text):
-        self.screen.blit(text[0], text[1])
-
-    def draw_players(self):
-        self.screen.blit(self.player1_image, (self.player1.get_position().x - self.player1.get_radius(),
-                                              self.window.y - self.player1.get_position().y -
-                                              self.player1.get_radius()))
-        self.screen.blit(self.player2_image, (self.player2.get_position().x - self.player2.get_radius(),
-                                              self.window.y - self.player2.get_position().y -
-                                              self.player2.get_radius()))
-
-    def fake_draw_players(self):
-        self.screen.blit(self.player1_image, (self.player1.get_position_to_breaks().x - self.player1.get_radius(),
-                                              self.window.y - self.player1.get_position_to_breaks().y -
-                                              self.player1.get_radius()))
-        self.screen.blit(self.player2_image, (self.player2.get_position_to_breaks().x - self.player2.get_radius(),
-                                              self.window.y - self.player2.get_position_to_breaks().y -
-                                              self.player2.get_radius()))
-
-    def draw_ball(self):
-        surf = pygame.transform.rotate(self.ball_image, math.degrees(self.ball.get_body_angle()))
-        w, h = surf.get_size()
-        p = pymunk.pygame_util.to_pygame(self.ball.get_position() + pymunk.Vec2d(-w / 2, h / 2), self.screen)
-        self.screen.blit(surf, p)
-
-    def fake_draw_ball(self):
-        surf = pygame.transform.rotate(self.ball_image, math.degrees(self.ball.get_position_to_breaks()['angle']))
-        w, h = surf.get_size()
-        p = pymunk.pygame_util.to_pygame(self.ball.get_position_to_breaks()['pos'] + pymunk.Vec2d(-w / 2, h / 2),
-                                         self.screen)
-        self.screen.blit(surf, p)
+        text.draw(self.screen)
+
+    def draw_players(self, snapshot):
+        self.screen.blit(self.player1_image, (snapshot.player1_x - self.player1.get_radius(),
+                                              self.window.y - snapshot.player1_y - self.player1.get_radius()))
+        self.screen.blit(self.player2_image, (snapshot.player2_x - self.player2.get_radius(),
+                                              self.window.y - snapshot.player2_y - self.player2.get_radius()))
+
+    @staticmethod
+    def create_ball_images(image):
+        ball_images = []
+        for rotation in range(Game.BALL_ROTATIONS):
+            surf = pygame.transform.rotate(image, rotation * 360.0 / Game.BALL_ROTATIONS)
+            ball_images.append((surf, surf.get_width() / 2, surf.get_height() / 2))
+        return ball_images
+
+    def rotated_ball_image(self, angle):
+        return self.ball_images[int(round(math.degrees(angle) * Game.BALL_ROTATIONS / 360.0)) % Game.BALL_ROTATIONS]
+
+    def draw_ball(self, snapshot):
+        surf, half_w, half_h = self.rotated_ball_image(snapshot.ball_angle)
+        self.screen.blit(surf, (int(snapshot.ball_x - half_w), self.window.y - int(snapshot.ball_y + half_h)))
 
     @staticmethod
     def handle_music():
@@ -0,0 +1,293 @@
+import argparse
+import hashlib
+import itertools
+import mmap
+import multiprocessing
+import os
+import struct
+import pymunk
+
+from Player import Player
+from Ball import Ball
+from Frame import Net
+from Game import Game
+
+
+class LandingTable:
+    TABLE = "res/landing_table.bin"
+    MAGIC = b'VBLAND02'
+    HEADER = struct.Struct('<8s16sI')
+    AXIS = struct.Struct('<16sddI')
+    HEADER_SIZE = 256
+    RECORD_FLOATS = 4
+    RECORD_SIZE = 4 * RECORD_FLOATS
+    WINDOW = pymunk.Vec2d(1200, 650)
+    MAX_FLIGHT_TIME = 10.0
+    CHUNK = 64
+
+    NOT_COMPUTED = 0.0
+    LANDED = 1.0
+    NOT_LANDED = 2.0
+
+    AXES = (('ball_x', 650.0, 1150.0, 11),
+            ('ball_y', 140.0, 500.0, 8),
+            ('ball_vx', -600.0, 600.0, 7),
+            ('ball_vy', -800.0, 400.0, 7),
+            ('player_vx', -400.0, 400.0, 3),
+            ('jump_phase', 0.0, 1.0, 5))
+
+    def __init__(self, path=TABLE):
+        self.file = open(path, 'rb')
+        self.map = None
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, fingerprint, axes_count = LandingTable.HEADER.unpack_from(self.map, 0)
+            if magic != LandingTable.MAGIC:
+                raise ValueError("{} is not a landing table".format(path))
+            if fingerprint != physics_fingerprint():
+                raise ValueError("{} was built for different Ball/Player constants, rebuild it".format(path))
+            self.axes = read_axes(self.map, axes_count)
+            self.jump_phase_start = jump_phase_start(self.axes)
+        except (ValueError, struct.error):
+            if self.map is not None:
+                self.map.close()
+            self.file.close()
+            raise
+        self.strides = axis_strides(self.axes)
+        self.records = memoryview(self.map)[LandingTable.HEADER_SIZE:].cast('f')
+
+    def close(self):
+        self.records.release()
+        self.map.close()
+        self.file.close()
+
+    def get_axes(self):
+        return self.axes
+
+    def get_record(self, index):
+        offset = index * LandingTable.RECORD_FLOATS
+        return self.records[offset:offset + LandingTable.RECORD_FLOATS]
+
+    def query(self, ball_pos, ball_vel, player_vel_x, jump_phase, scale_factor=None, player='player1'):
+        sx = scale_factor['x'] if scale_factor else 1.0
+        sy = scale_factor['y'] if scale_factor else 1.0
+        state = [ball_pos[0] / sx, ball_pos[1] / sy, ball_vel[0] / sx, ball_vel[1] / sy, player_vel_x / sx,
+                 jump_phase]
+        if player == 'player2':
+            state[0] = LandingTable.WINDOW.x - state[0]
+            state[2] = -state[2]
+            state[4] = -state[4]
+
+        corners = []
+        for value, (name, low, high, count) in zip(state, self.axes):
+            position = (min(max(value, low), high) - low) / (high - low) * (count - 1) if count > 1 else 0.0
+            i = min(int(position), count - 2) if count > 1 else 0
+            t = position - i
+            corners.append(((i, 1.0 - t), (i + 1, t)) if count > 1 else ((0, 1.0),))
+
+        total_weight = landing_x = flight_time = crosses_net = 0.0
+        for corner in itertools.product(*corners):
+            weight = 1.0
+            index = 0
+            for (i, w), stride in zip(corner, self.strides):
+                weight *= w
+                index += i * stride
+            if weight == 0.0:
+                continue
+            record = self.get_record(index)
+            if record[3] != LandingTable.LANDED:
+                continue
+            total_weight += weight
+            landing_x += weight * record[0]
+            flight_time += weight * record[1]
+            crosses_net += weight * record[2]
+
+        if total_weight == 0.0:
+            return None
+        landing_x /= total_weight
+        if player == 'player2':
+            landing_x = LandingTable.WINDOW.x - landing_x
+        return {'x': landing_x * sx, 'time': flight_time / total_weight,
+                'crosses_net': crosses_net / total_weight >= 0.5}
+
+    def jump_phase_of(self, player):
+        if not player.is_jumping():
+            return 0.0
+        flight = min(max((1.0 - player.body.velocity.y / player.jump_velocity) / 2, 0.0), 1.0)
+        return self.jump_phase_start + (1.0 - self.jump_phase_start) * flight
+
+
+def physics_fingerprint():
+    scale_factor = {'x': 1.0, 'y': 1.0, 'xy': 1.0}
+    space = Game.create_space(Game.GRAVITY)
+    ball = Ball(space, (0, 0), (0, 0), scale_factor)
+    player = Player(space, (0, 0), scale_factor)
+    frames = Game.create_frames(space, LandingTable.WINDOW, scale_factor)
+    constants = (Ball.MASS, tuple(Ball.MAX_VELOCITY), Ball.MAX_ANGULAR_VELOCITY, Ball.RADIUS,
+                 ball.get_shape().elasticity, ball.get_shape().friction,
+                 Player.MASS, Player.VELOCITY, Player.JUMP_VELOCITY, Player.RADIUS, Player.LANDING_MARGIN,
+                 player.get_shape().elasticity, player.get_shape().friction,
+                 Net.THICKNESS, Game.GRAVITY, Game.STEP_WORLD, space.sleep_time_threshold,
+                 tuple((key, frames[key].get_shape().elasticity, frames[key].get_shape().friction)
+                       for key in sorted(frames)))
+    return hashlib.sha1(repr(constants).encode()).digest()[:16]
+
+
+def read_axes(buffer, axes_count):
+    axes = []
+    for i in range(axes_count):
+        name, low, high, count = LandingTable.AXIS.unpack_from(buffer, LandingTable.HEADER.size +
+                                                               i * LandingTable.AXIS.size)
+        axes.append((name.rstrip(b'\0').decode(), low, high, count))
+    return tuple(axes)
+
+
+def jump_phase_start(axes):
+    for name, low, high, count in axes:
+        if name == 'jump_phase':
+            if count < 3:
+                raise ValueError("jump_phase needs at least 3 grid points, got {}".format(count))
+            return 1.0 / (count - 1)
+    raise ValueError("landing table has no jump_phase axis")
+
+
+def axis_strides(axes):
+    strides = []
+    stride = 1
+    for axis in reversed(axes):
+        strides.append(stride)
+        stride *= axis[3]
+    return tuple(reversed(strides))
+
+
+def axis_value(axis, i):
+    name, low, high, count = axis
+    return low if count == 1 else low + (high - low) * i / (count - 1)
+
+
+def cell_state(axes, index):
+    state = []
+    for axis, stride in zip(axes, axis_strides(axes)):
+        state.append(axis_value(axis, index // stride % axis[3]))
+    return state
+
+
+def simulate(ball_x, ball_y, ball_vx, ball_vy, player_vx, jump_phase, phase_start):
+    scale_factor = {'x': 1.0, 'y': 1.0, 'xy': 1.0}
+    window = LandingTable.WINDOW
+    space = Game.create_space(Game.GRAVITY)
+    frames = Game.create_frames(space, window, scale_factor)
+    ball = Ball(space, (ball_x, ball_y), (ball_x, ball_y), scale_factor)
+    player_start = (ball_x, window.y / 22 + Player.RADIUS)
+    player = Player(space, player_start, scale_factor)
+
+    if jump_phase < phase_start:
+        player.body.velocity = (player_vx, 0.0)
+    else:
+        flight = (jump_phase - phase_start) / (1.0 - phase_start)
+        player.set_position((ball_x, max(ball_y - ball.get_radius() - player.get_radius() + 1.0, player_start[1])))
+        player.body.velocity = (player_vx, player.jump_velocity * (1.0 - 2.0 * flight))
+        player.set_jumping(True)
+    ball.body.velocity = (ball_vx, ball_vy)
+    ball.body.activate()
+
+    net_x = frames['net'].get_positions()[0].x
+    crosses_net = False
+    steps = int(LandingTable.MAX_FLIGHT_TIME / Game.STEP_WORLD)
+    for step in range(1, steps + 1):
+        space.step(Game.STEP_WORLD)
+        ball.check_velocity_restrictions()
+
+        if player.is_falling() and player.get_position().y <= player.get_landing_height():
+            player.set_jumping(False)
+            player.definitive_stop()
+            player.set_position((player.get_position().x, player.get_start_position().y))
+        elif player.get_position().x - player.get_radius() <= net_x + 0.3 * player.get_radius() or\
+                player.get_position().x >= window.x - 1.3 * player.get_radius():
+            player.stop()
+        elif player.is_jumping():
+            player.moves(player_vx / player.speed)
+        if Game.check_collision(player, ball):
+            player.set_start_rotation()
+
+        crosses_net = crosses_net or ball.get_position().x < net_x
+        if Game.check_collision(ball, frames['ground_player1']) or\
+                Game.check_collision(ball, frames['ground_player2']):
+            return ball.get_position().x, step * Game.STEP_WORLD, float(crosses_net), LandingTable.LANDED
+
+    return ball.get_position().x, LandingTable.MAX_FLIGHT_TIME, float(crosses_net), LandingTable.NOT_LANDED
+
+
+def simulate_chunk(args):
+    axes, indices = args
+    phase_start = jump_phase_start(axes)
+    return [(index, simulate(*cell_state(axes, index), phase_start)) for index in indices]
+
+
+def open_for_sweep(path, axes):
+    cells = 1
+    for axis in axes:
+        cells *= axis[3]
+    size = LandingTable.HEADER_SIZE + cells * LandingTable.RECORD_SIZE
+
+    header = bytearray(LandingTable.HEADER_SIZE)
+    LandingTable.HEADER.pack_into(header, 0, LandingTable.MAGIC, physics_fingerprint(), len(axes))
+    for i, (name, low, high, count) in enumerate(axes):
+        LandingTable.AXIS.pack_into(header, LandingTable.HEADER.size + i * LandingTable.AXIS.size,
+                                    name.encode(), low, high, count)
+
+    resume = os.path.exists(path) and os.path.getsize(path) == size
+    if resume:
+        with open(path, 'rb') as table:
+            resume = table.read(LandingTable.HEADER_SIZE) == bytes(header)
+    if not resume:
+        with open(path, 'wb') as table:
+            table.write(header)
+            table.truncate(size)
+
+    table = open(path, 'r+b')
+    return table, mmap.mmap(table.fileno(), size), cells
+
+
+def sweep(path=LandingTable.TABLE, axes=LandingTable.AXES, workers=None):
+    jump_phase_start(axes)
+    table, table_map, cells = open_for_sweep(path, axes)
+    records = memoryview(table_map)[LandingTable.HEADER_SIZE:].cast('f')
+    pending = [index for index in range(cells)
+               if records[index * LandingTable.RECORD_FLOATS + 3] == LandingTable.NOT_COMPUTED]
+    print('{} of {} cells to simulate'.format(len(pending), cells))
+
+    chunks = [(axes, pending[i:i + LandingTable.CHUNK]) for i in range(0, len(pending), LandingTable.CHUNK)]
+    done = cells - len(pending)
+    try:
+        with multiprocessing.Pool(workers) as pool:
+            for results in pool.imap_unordered(simulate_chunk, chunks):
+                for index, record in results:
+                    offset = index * LandingTable.RECORD_FLOATS
+                    for i, value in enumerate(record):
+                        records[offset + i] = value
+                table_map.flush()
+                done += len(results)
+                print('{}/{}'.format(done, cells), end='\r')
+    finally:
+        records.release()
+        table_map.close()
+        table.close()
+    print()
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Build or resume the serve/return landing lookup table.')
+    parser.add_argument('--output', default=LandingTable.TABLE)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--counts', type=int, nargs=len(LandingTable.AXES),
+                        default=[axis[3] for axis in LandingTable.AXES],
+                        help='grid points per axis: ' + ' '.join(axis[0] for axis in LandingTable.AXES))
+    arguments = parser.parse_args()
+
+    try:
+        sweep(arguments.output, tuple((name, low, high, count) for (name, low, high, _), count
+                                      in zip(LandingTable.AXES, arguments.counts)), arguments.workers)
+    except ValueError as error:
+        parser.error(str(error))
\ No newline at end of file
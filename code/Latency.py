@@ -0,0 +1,92 @@
+import time
+import pygame
+
+
+class LatencyMonitor:
+    BUCKETS = (1, 2, 4, 8, 16, 33, 50, 66, 100)
+    INPUT_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+
+    def __init__(self):
+        self.last_poll = None
+        self.pending = []
+        self.histogram = [0] * (len(LatencyMonitor.BUCKETS) + 1)
+        self.count = 0
+        self.dropped = 0
+        self.total = 0.0
+        self.total_min = 0.0
+        self.total_max = 0.0
+        self.worst = 0.0
+
+    def sampled(self, events, exact_first=False):
+        now = time.perf_counter()
+        earliest = self.last_poll if self.last_poll is not None else now
+        for event in events:
+            if event.type in LatencyMonitor.INPUT_EVENTS:
+                if exact_first and event is events[0]:
+                    self.pending.append((now, now))
+                else:
+                    self.pending.append((earliest, now))
+        self.last_poll = now
+
+    def presented(self):
+        if not self.pending:
+            return
+        now = time.perf_counter()
+        for earliest, latest in self.pending:
+            latency = 1000 * (now - (earliest + latest) / 2)
+            self.count += 1
+            self.total += latency
+            self.total_min += 1000 * (now - latest)
+            self.total_max += 1000 * (now - earliest)
+            self.worst = max(self.worst, latency)
+            bucket = 0
+            while bucket < len(LatencyMonitor.BUCKETS) and latency >= LatencyMonitor.BUCKETS[bucket]:
+                bucket += 1
+            self.histogram[bucket] += 1
+        self.pending = []
+
+    def not_presented(self):
+        self.dropped += len(self.pending)
+        self.pending = []
+
+    def report(self):
+        if not self.count:
+            return 'No input events presented ({} dropped without a redraw)'.format(self.dropped)
+        lines = ['Input-to-present latency over {} events: mean {:.2f} ms (bounds {:.2f}-{:.2f} ms), '
+                 'worst {:.2f} ms; {} dropped without a redraw'.format(self.count, self.total / self.count,
+                                                                       self.total_min / self.count,
+                                                                       self.total_max / self.count, self.worst,
+                                                                       self.dropped)]
+        low = 0
+        for high, events in zip(LatencyMonitor.BUCKETS + (None,), self.histogram):
+            label = '{:>4}-{:<4} ms'.format(low, high) if high else '{:>4}+     ms'.format(low)
+            lines.append('  {} {:>6} {}'.format(label, events, '#' * int(50 * events / self.count)))
+            low = high
+        return '\n'.join(lines)
+
+
+class FramePacer:
+    SAFETY_MARGIN = 0.002
+    WORK_SMOOTHING = 0.05
+
+    def __init__(self):
+        self.deadline = None
+        self.work = 0.0
+        self.work_start = None
+        self.period = 0.0
+
+    def wait_for_sampling(self, period):
+        now = time.perf_counter()
+        if self.deadline is None or self.deadline < now:
+            self.deadline = now + self.work + FramePacer.SAFETY_MARGIN
+        delay = self.deadline - self.work - FramePacer.SAFETY_MARGIN - now
+        if delay > 0:
+            time.sleep(delay)
+        self.work_start = time.perf_counter()
+        self.period = period
+
+    def frame_presented(self):
+        now = time.perf_counter()
+        work = now - self.work_start
+        self.work = work if work > self.work else self.work + (work - self.work) * FramePacer.WORK_SMOOTHING
+        self.deadline = max(self.deadline, now) + self.period
\ No newline at end of file
@@ -4,10 +4,15 @@ import pymunk.pygame_util
 
 
 class Player:
+    __slots__ = ('mass', 'radius', 'jump_velocity', 'speed', 'start_pos', 'landing_height', 'jumping',
+                 'block_move_left', 'block_move_right', 'won', 'serves', 'dominates', 'collides_with_ball',
+                 'bounce_counter', 'score', 'body', 'shape', 'attribute_to_pause', 'position_to_breaks')
     MASS = 100
     VELOCITY = 400.0
     JUMP_VELOCITY = 800.0
     RADIUS = 40
+    LANDING_MARGIN = 20
+    ZERO = (0.0, 0.0)
     IMAGE = {'player1': "res/img/player1.png", 'player2': "res/img/player2.png"}
 
     def __init__(self, space, pos, scale_factor):
@@ -17,8 +22,10 @@ class Player:
         self.speed = Player.VELOCITY * scale_factor['x']
 
         self.start_pos = pymunk.Vec2d(pos)
+        self.landing_height = self.start_pos.y + Player.LANDING_MARGIN * scale_factor['y']
         self.jumping = False
-        self.block_move = {'left': False, 'right': False}
+        self.block_move_left = False
+        self.block_move_right = False
         self.won = False
         self.serves = True
         self.dominates = False
@@ -41,11 +48,22 @@ class Player:
     def get_position(self):
         return self.body.position
 
+    def get_velocity(self):
+        return self.body.velocity
+
+    def get_body_angle(self):
+        return self.body.angle
+
     def get_radius(self):
         return self.radius
 
-    def get_block_move(self):
-        return self.block_move
+    def get_landing_height(self):
+        return self.landing_height
+
+    def is_move_blocked(self, direction):
+        if direction == 'left':
+            return self.block_move_left
+        return self.block_move_right
 
     def get_start_position(self):
         return self.start_pos
@@ -56,6 +74,9 @@ class Player:
     def get_score(self):
         return self.score
 
+    def get_bounce_counter(self):
+        return self.bounce_counter
+
     def get_position_to_breaks(self):
         return self.position_to_breaks
 
@@ -80,6 +101,12 @@ class Player:
     def collision_with_ball(self):
         return self.collides_with_ball
 
+    def is_serving(self):
+        return self.serves
+
+    def is_dominating(self):
+        return self.dominates
+
     def set_dominance(self, dominance):
         self.dominates = dominance
 
@@ -90,7 +117,10 @@ class Player:
         self.collides_with_ball = collides
 
     def set_block_move(self, is_blocked, direction):
-        self.block_move[direction] = is_blocked
+        if direction == 'left':
+            self.block_move_left = is_blocked
+        else:
+            self.block_move_right = is_blocked
 
     def set_position_to_start_pos(self):
         self.body.position = self.start_pos
@@ -119,24 +149,52 @@ class Player:
         self.score = 0
 
     def jump(self):
-        self.body.velocity = pymunk.Vec2d(0.0, self.jump_velocity)
+        self.body.velocity = (0.0, self.jump_velocity)
         self.jumping = True
 
     def moves(self, direction):
-        self.body.velocity = pymunk.Vec2d(direction * self.speed, self.body.velocity.y)
+        self.body.velocity = (direction * self.speed, self.body.velocity.y)
 
     def stop(self):
-        self.body.velocity = pymunk.Vec2d(0.0, self.body.velocity.y)
+        self.body.velocity = (0.0, self.body.velocity.y)
 
     def definitive_stop(self):
-        self.body.velocity = pymunk.Vec2d.zero()
+        self.body.velocity = Player.ZERO
 
     def wakes_up(self):
-        self.body.velocity = pymunk.Vec2d(0.0, self.attribute_to_pause)
+        self.body.velocity = (0.0, self.attribute_to_pause)
 
     def sleep(self):
         self.body.sleep()
 
+    def overlaps_circle(self, x, y, radius):
+        position = self.body.position
+        dx = position.x - x
+        dy = position.y - y
+        limit = self.radius + radius
+        return dx * dx + dy * dy < limit * limit
+
+    def restore_from(self, other, ratio_x, ratio_y):
+        self.jumping = other.jumping
+        self.won = other.won
+        self.serves = other.serves
+        self.dominates = other.dominates
+        self.collides_with_ball = other.collides_with_ball
+        self.bounce_counter = other.bounce_counter
+        self.score = other.score
+        self.attribute_to_pause = other.attribute_to_pause * ratio_y
+        self.position_to_breaks = self.rescale_position(other.position_to_breaks, other.radius, ratio_x, ratio_y)
+
+        self.body.position = self.rescale_position(other.body.position, other.radius, ratio_x, ratio_y)
+        self.body.velocity = (other.body.velocity.x * ratio_x, other.body.velocity.y * ratio_y)
+        self.body.angle = other.body.angle
+        self.body.angular_velocity = other.body.angular_velocity
+        if other.body.is_sleeping:
+            self.body.sleep()
+
+    def rescale_position(self, position, radius, ratio_x, ratio_y):
+        return pymunk.Vec2d(position.x * ratio_x, (position.y - radius) * ratio_y + self.radius)
+
     def save_attribute_to_pause(self):
         self.attribute_to_pause = self.body.velocity.y
 
@@ -0,0 +1,36 @@
+import os
+import time
+
+
+class SettingsWatcher:
+    POLL_INTERVAL = 1.0
+
+    def __init__(self, settings_path, settings_loader):
+        self.settings_path = settings_path
+        self.settings_loader = settings_loader
+        self.modified = self.get_modified()
+        self.next_poll = time.monotonic() + SettingsWatcher.POLL_INTERVAL
+
+    def get_modified(self):
+        try:
+            return os.path.getmtime(self.settings_path)
+        except OSError:
+            return None
+
+    def poll(self):
+        now = time.monotonic()
+        if now < self.next_poll:
+            return None
+        self.next_poll = now + SettingsWatcher.POLL_INTERVAL
+        return self.check()
+
+    def check(self):
+        modified = self.get_modified()
+        if modified is None or modified == self.modified:
+            return None
+        try:
+            settings = self.settings_loader(self.settings_path)
+        except (IndexError, ValueError):
+            return None
+        self.modified = modified
+        return settings
\ No newline at end of file
@@ -0,0 +1,23 @@
+class Snapshot:
+    __slots__ = ('ball_x', 'ball_y', 'ball_angle', 'player1_x', 'player1_y', 'player2_x', 'player2_y',
+                 'score_text', 'winner_text', 'paused', 'music_playing')
+
+    def __init__(self, ball_x, ball_y, ball_angle, player1_x, player1_y, player2_x, player2_y, score_text,
+                 winner_text, paused, music_playing):
+        self.ball_x = ball_x
+        self.ball_y = ball_y
+        self.ball_angle = ball_angle
+        self.player1_x = player1_x
+        self.player1_y = player1_y
+        self.player2_x = player2_x
+        self.player2_y = player2_y
+        self.score_text = score_text
+        self.winner_text = winner_text
+        self.paused = paused
+        self.music_playing = music_playing
+
+    def is_paused(self):
+        return self.paused
+
+    def end_game(self):
+        return self.winner_text
\ No newline at end of file
@@ -0,0 +1,155 @@
+import argparse
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from Game import Game
+from Ball import Ball
+from Player import Player
+from Volleyball import open_settings
+
+
+class StressTest:
+    COUNTS = (0, 25, 50, 100, 200, 400)
+    FRAMES = 300
+    WARMUP_FRAMES = 30
+    PLAYERS_SHARE = 0.25
+    SEED = 2019
+
+    def __init__(self, frames=FRAMES, draw=True, iterations=None, spatial_hash=None):
+        self.frames = frames
+        self.draw = draw
+        window_size, fps = open_settings(Game.SETTINGS)
+        self.game = Game(window_size, fps)
+        self.game.set_blocking(False)
+        if iterations:
+            self.game.space.iterations = iterations
+        if spatial_hash:
+            self.game.space.use_spatial_hash(spatial_hash * self.game.scale_factor['xy'], 1000)
+        self.random = random.Random(StressTest.SEED)
+        self.balls = []
+        self.players = []
+
+    def random_position(self, radius):
+        window = self.game.window
+        return (self.random.uniform(radius, window.x - radius),
+                self.random.uniform(window.y / 22 + radius, window.y - radius))
+
+    def add_entities(self, count):
+        scale_factor = self.game.scale_factor
+        players_count = int(count * StressTest.PLAYERS_SHARE)
+        for i in range(players_count):
+            player = Player(self.game.space, self.random_position(Player.RADIUS * scale_factor['x']), scale_factor)
+            self.players.append(player)
+        for i in range(count - players_count):
+            position = self.random_position(Ball.RADIUS * scale_factor['x'])
+            ball = Ball(self.game.space, position, position, scale_factor)
+            ball.body.velocity = (self.random.uniform(-400.0, 400.0) * scale_factor['x'],
+                                  self.random.uniform(-400.0, 400.0) * scale_factor['y'])
+            ball.body.activate()
+            self.balls.append(ball)
+
+    def remove_entities(self):
+        for entity in self.balls + self.players:
+            self.game.space.remove(entity.body, entity.get_shape())
+        self.balls = []
+        self.players = []
+
+    def check_collisions(self):
+        players = [self.game.player1, self.game.player2] + self.players
+        frames = self.game.frames_to_bounce
+        collisions = 0
+        for ball in self.balls:
+            for player in players:
+                collisions += Game.check_collision(player, ball)
+            for frame in frames:
+                collisions += Game.check_collision(frame, ball)
+        return collisions
+
+    def draw_entities(self):
+        screen = self.game.screen
+        window = self.game.window
+        for ball in self.balls:
+            surf, half_w, half_h = self.game.rotated_ball_image(ball.get_body_angle())
+            position = ball.get_position()
+            screen.blit(surf, (int(position.x - half_w), window.y - int(position.y + half_h)))
+        for player in self.players:
+            position = player.get_position()
+            screen.blit(self.game.player1_image, (position.x - player.get_radius(),
+                                                  window.y - position.y - player.get_radius()))
+
+    def play_frame(self):
+        start = time.perf_counter()
+        self.game.interface()
+        self.game.space.step(Game.STEP_WORLD)
+        for ball in self.balls:
+            ball.check_velocity_restrictions()
+        physics_end = time.perf_counter()
+        self.check_collisions()
+        collisions_end = time.perf_counter()
+        if self.draw:
+            self.game.draw_snapshot(self.game.take_snapshot())
+            self.draw_entities()
+            pygame.display.flip()
+        end = time.perf_counter()
+        return end - start, physics_end - start, collisions_end - physics_end, end - collisions_end
+
+    def measure(self, count):
+        rss_before = rss_kilobytes()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        self.add_entities(count)
+        self.play_frame()
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        for frame in range(StressTest.WARMUP_FRAMES):
+            self.play_frame()
+        timings = [self.play_frame() for frame in range(self.frames)]
+        rss_after = rss_kilobytes()
+        self.remove_entities()
+
+        frame_times = sorted(timing[0] for timing in timings)
+        return {'entities': count,
+                'ticks_per_second': len(timings) / sum(frame_times),
+                'frame': 1000 * sum(frame_times) / len(frame_times),
+                'frame_p95': 1000 * frame_times[int(0.95 * (len(frame_times) - 1))],
+                'physics': 1000 * sum(timing[1] for timing in timings) / len(timings),
+                'collisions': 1000 * sum(timing[2] for timing in timings) / len(timings),
+                'draw': 1000 * sum(timing[3] for timing in timings) / len(timings),
+                'py_heap': (after - before) / 1024,
+                'rss': rss_after - rss_before if rss_before is not None else None}
+
+
+def rss_kilobytes():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Fill the court with extra bodies and report how frames scale.')
+    parser.add_argument('--counts', type=int, nargs='+', default=list(StressTest.COUNTS))
+    parser.add_argument('--frames', type=int, default=StressTest.FRAMES)
+    parser.add_argument('--no-draw', dest='draw', action='store_false', help='skip sprite drawing')
+    parser.add_argument('--iterations', type=int, help='pymunk Space.iterations')
+    parser.add_argument('--spatial-hash', type=float, metavar='DIM', help='use a spatial hash with cell size DIM')
+    arguments = parser.parse_args()
+
+    stress_test = StressTest(arguments.frames, arguments.draw, arguments.iterations, arguments.spatial_hash)
+    print('{:>8} {:>10} {:>10} {:>10} {:>10} {:>11} {:>8} {:>11} {:>9}'.format(
+        'entities', 'ticks/s', 'frame ms', 'p95 ms', 'physics ms', 'collide ms', 'draw ms', 'py heap KB', 'rss KB'))
+    for count in arguments.counts:
+        result = stress_test.measure(count)
+        rss = '{:>9.0f}'.format(result['rss']) if result['rss'] is not None else '{:>9}'.format('n/a')
+        print('{entities:>8} {ticks_per_second:>10.1f} {frame:>10.3f} {frame_p95:>10.3f} {physics:>10.3f} '
+              '{collisions:>11.3f} {draw:>8.3f} {py_heap:>11.1f} '.format(**result) + rss)
\ No newline at end of file
@@ -1,23 +1,47 @@
+import io
+import collections
 import pygame
 import pymunk
 import pymunk.pygame_util
 
 
 class Text:
+    __slots__ = ('text', 'text_surf', 'text_size', 'text_rect')
     BLACK = (0, 0, 0)
     RED = (255, 0, 0)
     SIZE = 100
     MAIN_FONT = "res/fonts/BKANT.ttf"
+    FONT_CACHE_SIZE = 24
+    fonts = collections.OrderedDict()
+    font_files = {}
 
     def __init__(self, font_source, scale_factor, text_color, text, text_pos_x=0, text_pos_y=0):
-        main_font = pygame.font.Font(font_source, int(Text.SIZE * scale_factor))
+        self.text = text
+        main_font = Text.load_font(font_source, int(Text.SIZE * scale_factor))
         self.text_surf = main_font.render(text, True, text_color)
         self.text_size = pymunk.Vec2d(self.text_surf.get_width(), self.text_surf.get_height())
         self.text_rect = self.text_surf.get_rect()
         self.text_rect.center = (text_pos_x, text_pos_y)
 
-    def to_draw(self):
-        return self.text_surf, self.text_rect
+    def get_text(self):
+        return self.text
+
+    def draw(self, screen):
+        screen.blit(self.text_surf, self.text_rect)
 
     def set_text_center(self, text_pos):
-        self.text_rect.center = text_pos
\ No newline at end of file
+        self.text_rect.center = text_pos
+
+    @staticmethod
+    def load_font(font_source, size):
+        key = (font_source, size)
+        if key in Text.fonts:
+            Text.fonts.move_to_end(key)
+        else:
+            if font_source not in Text.font_files:
+                with open(font_source, 'rb') as font_file:
+                    Text.font_files[font_source] = font_file.read()
+            Text.fonts[key] = pygame.font.Font(io.BytesIO(Text.font_files[font_source]), size)
+            if len(Text.fonts) > Text.FONT_CACHE_SIZE:
+                Text.fonts.popitem(last=False)
+        return Text.fonts[key]
\ No newline at end of file
@@ -0,0 +1,128 @@
+import queue
+import threading
+import time
+import pygame
+
+from Game import Game
+
+
+class SnapshotBuffer:
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.snapshot = None
+        self.version = 0
+
+    def publish(self, snapshot):
+        with self.condition:
+            self.snapshot = snapshot
+            self.version += 1
+            self.condition.notify()
+
+    def wait_for_newer(self, version, timeout):
+        with self.condition:
+            if self.version == version:
+                self.condition.wait(timeout)
+            return self.snapshot, self.version
+
+
+class SimulationThread(threading.Thread):
+
+    def __init__(self, game, snapshots, world_hash=None):
+        super(SimulationThread, self).__init__(name='simulation', daemon=True)
+        self.game = game
+        self.snapshots = snapshots
+        self.world_hash = world_hash
+        self.events = queue.Queue()
+        self.lock = threading.Lock()
+        self.running = True
+
+    def stop(self):
+        self.running = False
+        self.events.put(None)
+
+    def collect_events(self, deadline):
+        list_of_events = []
+        if self.game.is_paused():
+            try:
+                list_of_events.append(self.events.get(timeout=max(deadline - time.perf_counter(), 0.0)))
+            except queue.Empty:
+                pass
+        else:
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        while True:
+            try:
+                list_of_events.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return [event for event in list_of_events if event is not None]
+
+    def run(self):
+        deadline = time.perf_counter()
+        while self.running:
+            list_of_events = self.collect_events(deadline)
+            if not self.running:
+                break
+            period = self.game.frame_period()
+            deadline = max(deadline, time.perf_counter() - period) + period
+
+            with self.lock:
+                self.game.interface(list_of_events)
+                if not self.game.is_idle():
+                    self.game.simulate()
+                if self.game.redraw or not self.game.is_idle():
+                    self.snapshots.publish(self.game.take_snapshot())
+                    self.game.redraw = False
+                if self.world_hash:
+                    self.world_hash.record(self.game)
+
+
+class ThreadedRunner:
+    EVENT_POLL_INTERVAL = 1 / 60.0
+
+    def __init__(self, game, world_hash=None, settings_watcher=None):
+        self.game = game
+        self.game.set_blocking(False)
+        self.settings_watcher = settings_watcher
+        self.snapshots = SnapshotBuffer()
+        self.simulation = SimulationThread(game, self.snapshots, world_hash)
+
+    @staticmethod
+    def wants_to_quit(event):
+        return event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE)
+
+    def resize(self, window_size, settings):
+        with self.simulation.lock:
+            if settings:
+                self.game.apply_settings(*settings)
+            if window_size:
+                self.game.resize(window_size)
+            self.snapshots.publish(self.game.take_snapshot())
+
+    def run(self):
+        self.simulation.start()
+        version = 0
+        try:
+            while self.simulation.is_alive():
+                window_size = None
+                for event in pygame.event.get():
+                    if self.wants_to_quit(event):
+                        return
+                    if event.type == pygame.VIDEORESIZE:
+                        window_size = event.size
+                    else:
+                        self.simulation.events.put(event)
+                settings = self.settings_watcher.poll() if self.settings_watcher else None
+                if window_size or settings:
+                    self.resize(window_size, settings)
+
+                snapshot, newest = self.snapshots.wait_for_newer(version, ThreadedRunner.EVENT_POLL_INTERVAL)
+                if newest != version:
+                    version = newest
+                    self.game.draw_snapshot(snapshot)
+                    pygame.display.flip()
+        finally:
+            self.simulation.stop()
+            self.simulation.join()
\ No newline at end of file
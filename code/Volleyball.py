@@ -1,4 +1,14 @@
+import argparse
+import asyncio
+import collections
+import time
+
 from Game import Game
+from WorldHash import WorldHash
+from AsyncRunner import AsyncRunner, jitter_stats
+from Latency import LatencyMonitor, FramePacer
+from ThreadedRunner import ThreadedRunner
+from SettingsWatcher import SettingsWatcher
 
 
 def open_settings(settings_path):
@@ -16,19 +26,136 @@ def open_settings(settings_path):
     return window_size, fps
 
 
-def run_game():
+def run_game(hashes_path=None, late_input=False, measure_latency=False):
+
+    window_size, fps = open_settings(Game.SETTINGS)
+
+    game = Game(window_size, fps)
+
+    world_hash = WorldHash(hashes_path) if hashes_path else None
+
+    latency_monitor = LatencyMonitor() if measure_latency else None
+    game.set_latency_monitor(latency_monitor)
+
+    frame_pacer = FramePacer() if late_input else None
+    game.set_blocking(not late_input)
+
+    settings_watcher = SettingsWatcher(Game.SETTINGS, open_settings)
+
+    try:
+        while True:
+
+            settings = settings_watcher.poll()
+            if settings:
+                game.apply_settings(*settings)
+
+            if frame_pacer:
+                frame_pacer.wait_for_sampling(game.frame_period())
+
+            game.interface()
+
+            game.step()
+
+            if frame_pacer:
+                frame_pacer.frame_presented()
+
+            if world_hash:
+                world_hash.record(game)
+    finally:
+        if world_hash:
+            world_hash.close()
+        if latency_monitor:
+            print(latency_monitor.report())
+
+
+def run_game_threaded(hashes_path=None):
+
+    window_size, fps = open_settings(Game.SETTINGS)
+
+    game = Game(window_size, fps)
+
+    world_hash = WorldHash(hashes_path) if hashes_path else None
+
+    try:
+        ThreadedRunner(game, world_hash, SettingsWatcher(Game.SETTINGS, open_settings)).run()
+    finally:
+        if world_hash:
+            world_hash.close()
+
+    game.exit_game()
+
+
+def run_game_async(hashes_path=None, remote_input_port=None, spectator_port=None, log_path=None,
+                   host=AsyncRunner.HOST):
 
     window_size, fps = open_settings(Game.SETTINGS)
 
     game = Game(window_size, fps)
 
-    while True:
+    world_hash = WorldHash(hashes_path) if hashes_path else None
+
+    runner = AsyncRunner(game, SettingsWatcher(Game.SETTINGS, open_settings), remote_input_port, spectator_port,
+                         log_path, world_hash, host)
+
+    try:
+        asyncio.run(runner.run())
+    finally:
+        if world_hash:
+            world_hash.close()
+
+
+def measure_jitter(frames):
+
+    window_size, fps = open_settings(Game.SETTINGS)
+
+    game = Game(window_size, fps)
+
+    clock_jitter = collections.deque(maxlen=frames)
+    last_start = None
+    for frame in range(frames):
+        start = time.perf_counter()
+        if last_start is not None:
+            clock_jitter.append(abs(start - last_start - 1.0 / fps))
+        last_start = start
 
         game.interface()
 
         game.step()
 
+    runner = AsyncRunner(game)
+    asyncio.run(runner.run(frames))
+
+    return jitter_stats(clock_jitter), runner.get_jitter()
+
 
 if __name__ == '__main__':
 
-    run_game()
+    parser = argparse.ArgumentParser(description='Volleyball game.')
+    parser.add_argument('--record-hashes', metavar='PATH', help='record per-tick world hashes to PATH')
+    parser.add_argument('--late-input', action='store_true',
+                        help='sleep first and sample input as late as possible before each frame')
+    parser.add_argument('--latency', action='store_true', help='print input-to-present latency histogram on exit')
+    parser.add_argument('--threaded', action='store_true',
+                        help='simulate on a background thread and present snapshots on the main thread')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='run the frame loop and I/O services on asyncio')
+    parser.add_argument('--remote-input', type=int, metavar='PORT', help='accept remote key input on PORT (async)')
+    parser.add_argument('--spectator', type=int, metavar='PORT', help='stream game state to spectators on PORT (async)')
+    parser.add_argument('--log', metavar='PATH', help='append frame timing log to PATH (async)')
+    parser.add_argument('--host', default=AsyncRunner.HOST,
+                        help='interface for --remote-input and --spectator, e.g. 0.0.0.0 for all (async)')
+    parser.add_argument('--measure-jitter', type=int, metavar='FRAMES',
+                        help='compare frame jitter of fpsClock.tick and the asyncio runner, then exit')
+    arguments = parser.parse_args()
+
+    if arguments.measure_jitter:
+        for name, stats in zip(('fpsClock.tick', 'asyncio'), measure_jitter(arguments.measure_jitter)):
+            print('{}: jitter mean {:.3f} ms, p95 {:.3f} ms, max {:.3f} ms'.format(name, stats['mean'], stats['p95'],
+                                                                                 stats['max']))
+    elif arguments.threaded:
+        run_game_threaded(arguments.record_hashes)
+    elif arguments.use_async:
+        run_game_async(arguments.record_hashes, arguments.remote_input, arguments.spectator, arguments.log,
+                       arguments.host)
+    else:
+        run_game(arguments.record_hashes, arguments.late_input, arguments.latency)
\ No newline at end of file
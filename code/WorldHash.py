@@ -0,0 +1,112 @@
+import argparse
+import struct
+import zlib
+
+from Game import Game
+
+
+class WorldHash:
+    MAGIC = b'VBHASH03'
+    QUANTIZATION = 1000
+    FIELDS = ('ball.x', 'ball.y', 'ball.vx', 'ball.vy', 'ball.angle', 'ball.angular_velocity',
+              'player1.x', 'player1.y', 'player1.vx', 'player1.vy', 'player1.angle',
+              'player2.x', 'player2.y', 'player2.vx', 'player2.vy', 'player2.angle',
+              'player1.bounce_counter', 'player2.bounce_counter', 'player1.score', 'player2.score',
+              'player1.serves', 'player2.serves', 'player1.jumping', 'player2.jumping',
+              'player1.dominates', 'player2.dominates', 'player1.collides_with_ball', 'player2.collides_with_ball',
+              'gained_point.player1', 'gained_point.player2', 'break_timer', 'waiting')
+    QUANTIZED_FIELDS = FIELDS[:16]
+    STATE = struct.Struct('<{}q'.format(len(FIELDS)))
+    RECORD = struct.Struct('<II{}q'.format(len(FIELDS)))
+
+    def __init__(self, path):
+        self.file = open(path, 'wb')
+        self.file.write(WorldHash.MAGIC)
+        self.tick = 0
+
+    def record(self, game):
+        if game.is_paused():
+            return
+        state = world_state(game)
+        self.file.write(WorldHash.RECORD.pack(self.tick, world_hash(state), *state))
+        self.tick += 1
+
+    def close(self):
+        self.file.close()
+
+
+def field_value(name, value):
+    if name in WorldHash.QUANTIZED_FIELDS:
+        return value / WorldHash.QUANTIZATION
+    return value
+
+
+def world_state(game):
+    q = WorldHash.QUANTIZATION
+    ball = game.ball
+    player1 = game.player1
+    player2 = game.player2
+    ball_position = ball.get_position()
+    ball_velocity = ball.get_velocity()
+    player1_position = player1.get_position()
+    player1_velocity = player1.get_velocity()
+    player2_position = player2.get_position()
+    player2_velocity = player2.get_velocity()
+    gained_point = Game.gained_point
+    return (round(ball_position.x * q), round(ball_position.y * q),
+            round(ball_velocity.x * q), round(ball_velocity.y * q),
+            round(ball.get_body_angle() * q), round(ball.get_angular_velocity() * q),
+            round(player1_position.x * q), round(player1_position.y * q),
+            round(player1_velocity.x * q), round(player1_velocity.y * q), round(player1.get_body_angle() * q),
+            round(player2_position.x * q), round(player2_position.y * q),
+            round(player2_velocity.x * q), round(player2_velocity.y * q), round(player2.get_body_angle() * q),
+            player1.get_bounce_counter(), player2.get_bounce_counter(), player1.get_score(), player2.get_score(),
+            player1.is_serving(), player2.is_serving(), player1.is_jumping(), player2.is_jumping(),
+            player1.is_dominating(), player2.is_dominating(),
+            player1.collision_with_ball(), player2.collision_with_ball(),
+            bool(gained_point['player1']), bool(gained_point['player2']), Game.break_timer, game.is_waiting())
+
+
+def world_hash(state):
+    return zlib.crc32(WorldHash.STATE.pack(*state))
+
+
+def read_records(path):
+    with open(path, 'rb') as records:
+        if records.read(len(WorldHash.MAGIC)) != WorldHash.MAGIC:
+            raise ValueError("{} is not a world hash record".format(path))
+        data = records.read()
+    usable = len(data) - len(data) % WorldHash.RECORD.size
+    for values in WorldHash.RECORD.iter_unpack(data[:usable]):
+        yield values[0], values[1], values[2:]
+
+
+def first_divergence(path_a, path_b):
+    records_b = read_records(path_b)
+    for tick, hash_a, state_a in read_records(path_a):
+        record_b = next(records_b, None)
+        if record_b is None:
+            return {'tick': tick, 'fields': {}, 'reason': '{} ended'.format(path_b)}
+        if hash_a != record_b[1] or state_a != record_b[2]:
+            fields = {name: (a, b) for name, a, b in zip(WorldHash.FIELDS, state_a, record_b[2]) if a != b}
+            return {'tick': tick, 'fields': fields, 'reason': 'hash mismatch'}
+    record_b = next(records_b, None)
+    if record_b is not None:
+        return {'tick': record_b[0], 'fields': {}, 'reason': '{} ended'.format(path_a)}
+    return None
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Report the first tick where two world hash records diverge.')
+    parser.add_argument('first')
+    parser.add_argument('second')
+    arguments = parser.parse_args()
+
+    divergence = first_divergence(arguments.first, arguments.second)
+    if divergence is None:
+        print('Runs are identical')
+    else:
+        print('Runs diverge at tick {} ({})'.format(divergence['tick'], divergence['reason']))
+        for name, (a, b) in divergence['fields'].items():
+            print('  {}: {} != {}'.format(name, field_value(name, a), field_value(name, b)))
\ No newline at end of file